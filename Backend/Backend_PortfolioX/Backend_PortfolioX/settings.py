@@ -2,6 +2,8 @@
 Django settings for Backend_PortfolioX project.
 """
 
+import os
+import orjson
 from pathlib import Path
 from datetime import timedelta
 
@@ -40,11 +42,26 @@ INSTALLED_APPS = [
     'portfolio',
 ]
 
+# =============================================================================
+# ELASTICSEARCH (optionnel)
+# =============================================================================
+# Activé uniquement si ELASTICSEARCH_URL est défini ; sinon la recherche
+# des portfolios reste servie par la base de données.
+# Indexation initiale : python manage.py search_index --rebuild
+ELASTICSEARCH_URL = os.environ.get('ELASTICSEARCH_URL')
+if ELASTICSEARCH_URL:
+    INSTALLED_APPS.append('django_elasticsearch_dsl')
+    ELASTICSEARCH_DSL = {
+        'default': {'hosts': ELASTICSEARCH_URL},
+    }
+    ELASTICSEARCH_DSL_PARALLEL = True
+
 AUTH_USER_MODEL = 'utilisateur.Utilisateur'
 
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -78,10 +95,43 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'drf_orjson_renderer.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    # Comme le JSONRenderer de DRF : dates UTC suffixées par 'Z' et clés non
+    # textuelles converties (ex. erreurs de ListField indexées par position)
+    'ORJSON_RENDERER_OPTIONS': (orjson.OPT_UTC_Z, orjson.OPT_NON_STR_KEYS),
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20
 }
 
+# =============================================================================
+# CACHE
+# =============================================================================
+# Redis si REDIS_URL est défini (partagé entre les workers), sinon mémoire
+# locale au processus (développement)
+REDIS_URL = os.environ.get('REDIS_URL')
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'portfoliox',
+        }
+    }
+
+# Cache des compétences par catégorie, invalidé à chaque modification :
+# uniquement avec un cache partagé, LocMemCache n'invaliderait que le
+# processus courant et les autres workers serviraient des données périmées
+COMPETENCES_PAR_CATEGORIE_CACHE = bool(REDIS_URL)
+
 # =============================================================================
 # JWT CONFIGURATION
 # =============================================================================
@@ -60,12 +60,14 @@ def api_root(request):
                     'mes_portfolios': 'GET    /api/portfolio/portfolios/my/',
                     'portfolios_publies': 'GET    /api/portfolio/portfolios/published/',
                     'recherche_portfolios': 'GET    /api/portfolio/portfolios/search/',
+                    'nombre_portfolios': 'GET    /api/portfolio/portfolios/count/',
                     'publier_portfolio': 'POST   /api/portfolio/portfolios/{id}/publish/',
                     'statistiques_portfolio': 'GET    /api/portfolio/portfolios/{id}/stats/',
                     'dupliquer_portfolio': 'POST   /api/portfolio/portfolios/{id}/duplicate/',
                     'ajouter_contact': 'POST   /api/portfolio/portfolios/{id}/add-contact/',
                     'ajouter_competence': 'POST   /api/portfolio/portfolios/{id}/add-competence/',
-                    'ajouter_projet': 'POST   /api/portfolio/portfolios/{id}/add-projet/'
+                    'ajouter_projet': 'POST   /api/portfolio/portfolios/{id}/add-projet/',
+                    'ajouter_elements': 'POST   /api/portfolio/portfolios/{id}/add-items/'
                 },
                 'elements_portfolio': {
                     'contacts': {
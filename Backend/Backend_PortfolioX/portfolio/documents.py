@@ -0,0 +1,49 @@
+# portfolio/documents.py
+# Index Elasticsearch des portfolios, chargé uniquement si django_elasticsearch_dsl
+# est activé (voir ELASTICSEARCH_URL dans settings.py)
+from django_elasticsearch_dsl import Document, fields
+from django_elasticsearch_dsl.registries import registry
+
+from .models import Competence, Projet, Portfolio
+
+
+@registry.register_document
+class PortfolioDocument(Document):
+    statut = fields.KeywordField()
+    # Champs filtrables comme dans PortfolioFilter
+    utilisateur = fields.IntegerField(attr='utilisateur_id')
+    layout_type = fields.KeywordField()
+    # Données dénormalisées des relations
+    competence_names = fields.TextField()
+    langages = fields.TextField()
+    niveaux = fields.KeywordField(multi=True)
+    categories = fields.KeywordField(multi=True)
+
+    class Index:
+        name = 'portfolios'
+        settings = {'number_of_shards': 1, 'number_of_replicas': 0}
+
+    class Django:
+        model = Portfolio
+        fields = ['id_portfolio', 'titre', 'description', 'titre_professionnel', 'biographie', 'date_creation']
+        related_models = [Competence, Projet]
+        queryset_pagination = 500
+
+    def get_queryset(self):
+        return super().get_queryset().prefetch_related('competences', 'projets')
+
+    def get_instances_from_related(self, related_instance):
+        # Réindexer uniquement les portfolios liés à la compétence / au projet modifié
+        return related_instance.portfolios.all()
+
+    def prepare_competence_names(self, instance):
+        return ' '.join(c.nom_competence for c in instance.competences.all())
+
+    def prepare_langages(self, instance):
+        return ' '.join(p.langage_projet for p in instance.projets.all())
+
+    def prepare_niveaux(self, instance):
+        return sorted({c.niveau_competence for c in instance.competences.all()})
+
+    def prepare_categories(self, instance):
+        return sorted({c.categorie for c in instance.competences.all()})
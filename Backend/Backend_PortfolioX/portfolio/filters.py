@@ -0,0 +1,35 @@
+# portfolio/filters.py
+import django_filters
+from django.db.models import Exists, OuterRef
+
+from .models import Competence, Projet, Portfolio
+
+
+class PortfolioFilter(django_filters.FilterSet):
+    utilisateur = django_filters.NumberFilter(field_name='utilisateur__id_utilisateur')
+    # Filtres sur les relations M2M : sous-requêtes EXISTS, sans jointure ni DISTINCT
+    competence = django_filters.CharFilter(method='filter_competence')
+    langage = django_filters.CharFilter(method='filter_langage')
+    niveau = django_filters.CharFilter(method='filter_niveau')
+    categorie = django_filters.CharFilter(method='filter_categorie')
+
+    class Meta:
+        model = Portfolio
+        fields = ['statut', 'layout_type', 'utilisateur', 'competence', 'langage', 'niveau', 'categorie']
+
+    def _avec_competence(self, queryset, **lookups):
+        return queryset.filter(Exists(Competence.objects.filter(portfolios=OuterRef('pk'), **lookups)))
+
+    def filter_competence(self, queryset, name, value):
+        return self._avec_competence(queryset, nom_competence__icontains=value)
+
+    def filter_niveau(self, queryset, name, value):
+        return self._avec_competence(queryset, niveau_competence=value)
+
+    def filter_categorie(self, queryset, name, value):
+        return self._avec_competence(queryset, categorie=value)
+
+    def filter_langage(self, queryset, name, value):
+        return queryset.filter(Exists(Projet.objects.filter(
+            portfolios=OuterRef('pk'), langage_projet__icontains=value
+        )))
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.25 on 2026-10-15 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='portfolio',
+            index=models.Index(fields=['date_creation', 'id_portfolio'], name='portfolio_date_crea_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projet',
+            index=models.Index(fields=['date_ajout', 'id_projet'], name='projet_date_ajout_idx'),
+        ),
+    ]
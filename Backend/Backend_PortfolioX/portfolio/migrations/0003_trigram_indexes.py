@@ -0,0 +1,41 @@
+from django.db import migrations
+
+# Index trigrammes (pg_trgm) pour les recherches icontains.
+# Sous PostgreSQL, Django traduit icontains en UPPER(colonne::text) LIKE UPPER(%s) :
+# les index portent donc sur cette même expression.
+TRIGRAM_INDEXES = [
+    ('comp_name_trgm', 'portfolio_competence', 'nom_competence'),
+    ('projet_langage_trgm', 'portfolio_projet', 'langage_projet'),
+    ('portfolio_titre_trgm', 'portfolio_portfolio', 'titre'),
+    ('portfolio_desc_trgm', 'portfolio_portfolio', 'description'),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # pg_trgm n'existe que sous PostgreSQL (SQLite en développement)
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin (UPPER({column}::text) gin_trgm_ops)'
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0002_cursor_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
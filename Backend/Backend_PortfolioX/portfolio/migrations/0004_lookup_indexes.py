@@ -0,0 +1,37 @@
+# Generated by Django 4.2.25 on 2026-10-15 15:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='competence',
+            index=models.Index(fields=['utilisateur', 'est_visible', 'categorie'], name='competence_user_visible_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='competence',
+            index=models.Index(fields=['utilisateur', 'ordre'], name='competence_user_ordre_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contact',
+            index=models.Index(fields=['utilisateur', 'est_principal'], name='contact_user_principal_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='portfolio',
+            index=models.Index(fields=['statut', 'date_creation'], name='portfolio_statut_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projet',
+            index=models.Index(fields=['utilisateur', 'est_public'], name='projet_user_public_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projet',
+            index=models.Index(fields=['langage_projet'], name='projet_langage_idx'),
+        ),
+    ]
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from django.db import models
 from utilisateur.models import Utilisateur
 
@@ -24,6 +25,9 @@ class Contact(models.Model):
         verbose_name_plural = 'Contacts'
         ordering = ['ordre', 'date_ajout']
         db_table = 'portfolio_contact'
+        indexes = [
+            models.Index(fields=['utilisateur', 'est_principal'], name='contact_user_principal_idx'),
+        ]
     
     def __str__(self):
         return f"{self.type_contact}: {self.valeur_contact}"
@@ -63,10 +67,17 @@ class Competence(models.Model):
         ordering = ['categorie', 'ordre', 'nom_competence']
         unique_together = ['utilisateur', 'nom_competence']
         db_table = 'portfolio_competence'
+        indexes = [
+            models.Index(fields=['utilisateur', 'est_visible', 'categorie'], name='competence_user_visible_idx'),
+            models.Index(fields=['utilisateur', 'ordre'], name='competence_user_ordre_idx'),
+        ]
     
     def __str__(self):
         return f"{self.nom_competence} ({self.niveau_competence})"
 
+# Libellés des catégories, calculés une seule fois au chargement du module
+CATEGORIE_LABELS = dict(Competence._meta.get_field('categorie').flatchoices)
+
 class Projet(models.Model):
     id_projet = models.AutoField(primary_key=True)
     titre_projet = models.CharField(max_length=200, verbose_name='Titre du projet')
@@ -88,6 +99,11 @@ class Projet(models.Model):
         verbose_name_plural = 'Projets'
         ordering = ['ordre', '-date_realisation', 'titre_projet']
         db_table = 'portfolio_projet'
+        indexes = [
+            models.Index(fields=['date_ajout', 'id_projet'], name='projet_date_ajout_idx'),
+            models.Index(fields=['utilisateur', 'est_public'], name='projet_user_public_idx'),
+            models.Index(fields=['langage_projet'], name='projet_langage_idx'),
+        ]
     
     def __str__(self):
         return self.titre_projet
@@ -181,6 +197,10 @@ class Portfolio(models.Model):
         verbose_name_plural = 'Portfolios'
         ordering = ['-date_modification']
         db_table = 'portfolio_portfolio'
+        indexes = [
+            models.Index(fields=['date_creation', 'id_portfolio'], name='portfolio_date_crea_idx'),
+            models.Index(fields=['statut', 'date_creation'], name='portfolio_statut_date_idx'),
+        ]
     
     def __str__(self):
         # Utiliser les attributs disponibles du modèle Utilisateur
@@ -222,9 +242,9 @@ class Portfolio(models.Model):
         super().save(*args, **kwargs)
     
     def increment_vue_count(self):
-        """Incrémenter le compteur de vues"""
+        """Incrémenter le compteur de vues (UPDATE atomique, sans save())"""
+        Portfolio.objects.filter(pk=self.pk).update(vue_count=models.F('vue_count') + 1)
         self.vue_count += 1
-        self.save(update_fields=['vue_count'])
     
     def is_published(self):
         """Vérifier si le portfolio est publié"""
@@ -242,13 +262,10 @@ class Portfolio(models.Model):
     def get_competences_par_categorie(self):
         """Récupérer les compétences groupées par catégorie"""
         competences = self.competences.filter(est_visible=True).order_by('categorie', 'ordre')
-        result = {}
+        result = defaultdict(list)
         for competence in competences:
-            categorie = competence.get_categorie_display()
-            if categorie not in result:
-                result[categorie] = []
-            result[categorie].append(competence)
-        return result
+            result[CATEGORIE_LABELS.get(competence.categorie, competence.categorie)].append(competence)
+        return dict(result)
     
     def get_projets_visibles(self):
         """Récupérer les projets visibles"""
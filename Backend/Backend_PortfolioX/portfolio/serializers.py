@@ -1,3 +1,4 @@
+import serpy
 from rest_framework import serializers
 from .models import Contact, Competence, Projet, Portfolio
 from utilisateur.models import Utilisateur
@@ -128,6 +129,51 @@ class PortfolioListSerializer(serializers.ModelSerializer):
     def get_is_published(self, obj):
         return obj.is_published()
 
+# Serializers serpy (lecture seule) pour les listes de portfolios :
+# pas d'introspection DRF par champ, beaucoup plus rapides sur les listes
+class DateTimeSerpyField(serpy.Field):
+    # Même format de sortie que le DateTimeField de DRF
+    drf_field = serializers.DateTimeField()
+    
+    def to_value(self, value):
+        return self.drf_field.to_representation(value)
+
+class UtilisateurSimpleSerpy(serpy.Serializer):
+    id_utilisateur = serpy.IntField()
+    prenom = serpy.StrField()
+    nom = serpy.StrField()
+    email = serpy.StrField()
+    nom_complet = serpy.MethodField()
+    
+    def get_nom_complet(self, obj):
+        return f"{obj.prenom} {obj.nom}"
+
+class PortfolioListSerpy(serpy.Serializer):
+    id_portfolio = serpy.IntField()
+    titre = serpy.StrField()
+    slug = serpy.StrField()
+    utilisateur = UtilisateurSimpleSerpy()
+    statut = serpy.StrField()
+    date_creation = DateTimeSerpyField()
+    date_modification = DateTimeSerpyField()
+    vue_count = serpy.IntField()
+    nombre_contacts = serpy.MethodField()
+    nombre_competences = serpy.MethodField()
+    nombre_projets = serpy.MethodField()
+    is_published = serpy.MethodField()
+    
+    def get_nombre_contacts(self, obj):
+        return obj.contacts.count()
+    
+    def get_nombre_competences(self, obj):
+        return obj.competences.count()
+    
+    def get_nombre_projets(self, obj):
+        return obj.projets.count()
+    
+    def get_is_published(self, obj):
+        return obj.is_published()
+
 # Serializer pour Portfolio (Détail)
 class PortfolioDetailSerializer(serializers.ModelSerializer):
     utilisateur = UtilisateurSimpleSerializer(read_only=True)
@@ -204,7 +250,7 @@ class PortfolioCreateUpdateSerializer(serializers.ModelSerializer):
             # Vérifier les contacts
             contacts_ids = data.get('contacts_ids', [])
             for contact in contacts_ids:
-                if contact.utilisateur != utilisateur:
+                if contact.utilisateur_id != utilisateur.pk:
                     raise serializers.ValidationError(
                         f"Le contact {contact.id_contact} ne vous appartient pas"
                     )
@@ -212,7 +258,7 @@ class PortfolioCreateUpdateSerializer(serializers.ModelSerializer):
             # Vérifier les compétences
             competences_ids = data.get('competences_ids', [])
             for competence in competences_ids:
-                if competence.utilisateur != utilisateur:
+                if competence.utilisateur_id != utilisateur.pk:
                     raise serializers.ValidationError(
                         f"La compétence {competence.id_competence} ne vous appartient pas"
                     )
@@ -220,7 +266,7 @@ class PortfolioCreateUpdateSerializer(serializers.ModelSerializer):
             # Vérifier les projets
             projets_ids = data.get('projets_ids', [])
             for projet in projets_ids:
-                if projet.utilisateur != utilisateur:
+                if projet.utilisateur_id != utilisateur.pk:
                     raise serializers.ValidationError(
                         f"Le projet {projet.id_projet} ne vous appartient pas"
                     )
@@ -284,7 +330,7 @@ class PortfolioPublishSerializer(serializers.Serializer):
             
             # Vérifier qu'il n'y a pas déjà un portfolio publié pour cet utilisateur
             existing_published = Portfolio.objects.filter(
-                utilisateur=instance.utilisateur,
+                utilisateur_id=instance.utilisateur_id,
                 statut='publie'
             ).exclude(id_portfolio=instance.id_portfolio)
             
@@ -297,4 +343,9 @@ class PortfolioPublishSerializer(serializers.Serializer):
         instance.statut = statut
         instance.save()
         
-        return instance
\ No newline at end of file
+        return instance
+# Serializer pour l'ajout groupé d'éléments à un portfolio
+class PortfolioAddItemsSerializer(serializers.Serializer):
+    contacts = serializers.ListField(child=serializers.IntegerField(), required=False)
+    competences = serializers.ListField(child=serializers.IntegerField(), required=False)
+    projets = serializers.ListField(child=serializers.IntegerField(), required=False)
@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Competence
+
+# Durée de vie du cache des compétences par catégorie (secondes)
+COMPETENCES_PAR_CATEGORIE_TIMEOUT = 300
+
+
+def competences_par_categorie_cache_key(utilisateur_id):
+    return f"comp_par_cat:{utilisateur_id}"
+
+
+def invalidate_competences_par_categorie(utilisateur_id):
+    # Après le COMMIT : avant, une lecture concurrente remettrait en cache l'ancien état
+    key = competences_par_categorie_cache_key(utilisateur_id)
+    transaction.on_commit(lambda: cache.delete(key))
+
+
+@receiver(post_save, sender=Competence)
+@receiver(post_delete, sender=Competence)
+def competence_changed(sender, instance, **kwargs):
+    invalidate_competences_par_categorie(instance.utilisateur_id)
@@ -86,6 +86,11 @@ urlpatterns = [
          views.PortfolioViewSet.as_view({'post': 'add_projet'}), 
          name='add_projet_to_portfolio'),
     
+    # POST - Ajouter plusieurs contacts/compétences/projets en une requête
+    path('portfolios/<int:pk>/add-items/', 
+         views.PortfolioViewSet.as_view({'post': 'add_items'}), 
+         name='add_items_to_portfolio'),
+    
     # ==========================================================================
     # ENDPOINTS SPÉCIAUX POUR COMPÉTENCES ET PROJETS
     # ==========================================================================
@@ -157,7 +162,12 @@ PORTFOLIOS (CRUD STANDARD):
 PORTFOLIOS (ACTIONS PERSONNALISÉES):
   GET    /api/portfolio/portfolios/my/         - Mon portfolio (utilisateur connecté)
   GET    /api/portfolio/portfolios/published/  - Liste des portfolios publiés
+         (?stream=1 : export complet non paginé, envoyé en streaming)
   GET    /api/portfolio/portfolios/search/     - Recherche avancée
+         (via Elasticsearch si ELASTICSEARCH_URL est défini : mêmes filtres,
+          ?search= et ?ordering=, pagination ?page_size=&offset= avec la même
+          réponse next/previous/results ; sans ?ordering=, tri par pertinence)
+  GET    /api/portfolio/portfolios/count/      - Nombre total de portfolios (filtres appliqués)
   
   ACTIONS SUR UN PORTFOLIO SPÉCIFIQUE:
   POST   /api/portfolio/portfolios/{id}/publish/      - Publier/dépublier
@@ -166,12 +176,16 @@ PORTFOLIOS (ACTIONS PERSONNALISÉES):
   POST   /api/portfolio/portfolios/{id}/add-contact/  - Ajouter un contact
   POST   /api/portfolio/portfolios/{id}/add-competence/ - Ajouter une compétence
   POST   /api/portfolio/portfolios/{id}/add-projet/   - Ajouter un projet
+  POST   /api/portfolio/portfolios/{id}/add-items/    - Ajout groupé
+         {"contacts": [ids], "competences": [ids], "projets": [ids]}
 
 FILTRES DISPONIBLES:
   Contacts: Aucun filtre spécifique
   Compétences: ?categorie=frontend, ?niveau_competence=avance, ?est_visible=true
   Projets: ?langage_projet=Python, ?est_public=true, ?est_termine=true
-  Portfolios: ?statut=publie, ?utilisateur=1, ?competence=Python, ?langage=JavaScript
+  Portfolios: ?statut=publie, ?utilisateur=1, ?competence=Python, ?langage=JavaScript,
+              ?niveau=expert, ?categorie=backend, ?layout_type=classique
+              (mêmes filtres pour /portfolios/search/ via PortfolioFilter)
 
 RECHERCHE (search_fields):
   Contacts: valeur_contact, utilisateur__prenom, utilisateur__nom
@@ -183,12 +197,14 @@ TRI (ordering_fields):
   Contacts: ordre, date_ajout
   Compétences: nom_competence, categorie, ordre, annees_experience
   Projets: titre_projet, date_realisation, ordre
-  Portfolios: date_creation, date_modification, vue_count, titre
+  Portfolios: date_creation, id_portfolio
 
 PAGINATION:
   Toutes les listes sont paginées (12 éléments par page)
   Modifier avec ?page_size=20
   Maximum: 100 éléments par page
+  Portfolios et projets publics: pagination par curseur (liens next/previous,
+  pas de champ count -> utiliser /portfolios/count/ si le total est nécessaire)
 
 PERMISSIONS:
   Contacts/Compétences/Projets: Lecture pour tous, écriture pour propriétaire/admin
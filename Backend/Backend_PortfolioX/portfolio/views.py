@@ -1,37 +1,110 @@
 # portfolio/views.py
-from rest_framework import viewsets, status, permissions, filters
+from rest_framework import viewsets, status, permissions, filters, serializers
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, ValidationError
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.utils.urls import replace_query_param, remove_query_param
 from django_filters.rest_framework import DjangoFilterBackend
 from django.shortcuts import get_object_or_404
-from django.db.models import Q
-from django.db import transaction
+from django.db.models import Q, Count, Prefetch, prefetch_related_objects
+from django.db import transaction, IntegrityError
 from django.utils import timezone
+from django.core.cache import cache
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from itertools import groupby
+import hashlib
+import orjson
 
-from .models import Contact, Competence, Projet, Portfolio
+from .models import Contact, Competence, Projet, Portfolio, CATEGORIE_LABELS
 from .serializers import (
     ContactSerializer,
     CompetenceSerializer,
     ProjetSerializer,
     PortfolioListSerializer,
+    PortfolioListSerpy,
     PortfolioDetailSerializer,
     PortfolioCreateUpdateSerializer,
-    PortfolioPublishSerializer
+    PortfolioPublishSerializer,
+    PortfolioAddItemsSerializer
 )
+from .filters import PortfolioFilter
+from .signals import (
+    COMPETENCES_PAR_CATEGORIE_TIMEOUT,
+    competences_par_categorie_cache_key,
+    invalidate_competences_par_categorie
+)
+
+# Relations M2M d'un portfolio et modèle associé
+PORTFOLIO_RELATIONS = (
+    ('contacts', Contact),
+    ('competences', Competence),
+    ('projets', Projet),
+)
+
+# Colonnes lues par PortfolioListSerpy : les champs texte et JSON volumineux
+# (biographie, formations, expériences...) ne sont pas chargés pour les listes
+PORTFOLIO_LIST_FIELDS = (
+    'id_portfolio', 'titre', 'slug', 'statut', 'date_creation',
+    'date_modification', 'vue_count', 'utilisateur__id_utilisateur',
+    'utilisateur__prenom', 'utilisateur__nom', 'utilisateur__email'
+)
+
+# Champs recopiés lors de la duplication d'un portfolio
+CONTACT_CLONE_FIELDS = ('type_contact', 'valeur_contact', 'est_principal', 'ordre')
+COMPETENCE_CLONE_FIELDS = (
+    'nom_competence', 'niveau_competence', 'categorie', 'annees_experience',
+    'description', 'est_visible', 'ordre'
+)
+PROJET_CLONE_FIELDS = (
+    'titre_projet', 'description_projet', 'langage_projet', 'lien_projet',
+    'lien_github', 'technologies', 'date_realisation', 'est_public',
+    'est_termine', 'ordre'
+)
+
+# index.max_result_window par défaut : au-delà, Elasticsearch refuse la requête
+ELASTICSEARCH_MAX_RESULT_WINDOW = 10000
+
+# Durée de vie du cache des portfolios publiés (secondes)
+PUBLISHED_CACHE_TIMEOUT = 60 * 5
+
+def published_cache_key(request):
+    """Clé de cache d'une page de portfolios publiés (URL absolue : liens next/previous)"""
+    url = request.build_absolute_uri()
+    return f"portfolios_publies:{hashlib.md5(url.encode()).hexdigest()}"
+
+def stream_portfolios_json(queryset, chunk_size=500):
+    """Générer un tableau JSON de portfolios sans le construire en mémoire"""
+    yield b'['
+    for index, portfolio in enumerate(queryset.iterator(chunk_size=chunk_size)):
+        if index:
+            yield b','
+        yield orjson.dumps(PortfolioListSerpy(portfolio).data, option=orjson.OPT_UTC_Z)
+    yield b']'
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 100
 
+class StandardCursorPagination(CursorPagination):
+    # Pagination par curseur : pas de COUNT(*) ni d'OFFSET sur les grandes listes
+    page_size = 12
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+    ordering = ('-date_creation', '-id_portfolio')
+
+class ProjetCursorPagination(StandardCursorPagination):
+    ordering = ('-date_ajout', '-id_projet')
+
 class IsOwnerOrReadOnly(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS:
             return True
-        # CORRECTION : Utiliser request.user directement
-        return obj.utilisateur == request.user
+        # Comparer les identifiants évite de charger l'utilisateur lié
+        return obj.utilisateur_id == request.user.pk
 
 class PortfolioPermissions(permissions.BasePermission):
     def has_permission(self, request, view):
@@ -42,8 +115,8 @@ class PortfolioPermissions(permissions.BasePermission):
     def has_object_permission(self, request, view, obj):
         if request.method in permissions.SAFE_METHODS and obj.is_published():
             return True
-        # CORRECTION : Utiliser request.user directement
-        return obj.utilisateur == request.user
+        # Comparer les identifiants évite de charger l'utilisateur lié
+        return obj.utilisateur_id == request.user.pk
 
 class ContactViewSet(viewsets.ModelViewSet):
     serializer_class = ContactSerializer
@@ -85,16 +158,25 @@ class CompetenceViewSet(viewsets.ModelViewSet):
         # CORRECTION : Utiliser self.request.user directement
         serializer.save(utilisateur=self.request.user)
     
+    def _competences_par_categorie(self):
+        competences = self.get_queryset().filter(est_visible=True).order_by(
+            'categorie', 'ordre', 'nom_competence'
+        ).iterator(chunk_size=500)
+        result = {}
+        for categorie, groupe in groupby(competences, key=lambda c: c.categorie):
+            serializer = self.get_serializer(list(groupe), many=True)
+            result[CATEGORIE_LABELS.get(categorie, categorie)] = serializer.data
+        return result
+    
     @action(detail=False, methods=['get'])
     def par_categorie(self, request):
-        competences = self.get_queryset().filter(est_visible=True)
-        result = {}
-        for competence in competences:
-            categorie = competence.get_categorie_display()
-            if categorie not in result:
-                result[categorie] = []
-            serializer = self.get_serializer(competence)
-            result[categorie].append(serializer.data)
+        if not settings.COMPETENCES_PAR_CATEGORIE_CACHE:
+            return Response(self._competences_par_categorie())
+        key = competences_par_categorie_cache_key(request.user.pk)
+        result = cache.get(key)
+        if result is None:
+            result = self._competences_par_categorie()
+            cache.set(key, result, COMPETENCES_PAR_CATEGORIE_TIMEOUT)
         return Response(result)
 
 class ProjetViewSet(viewsets.ModelViewSet):
@@ -119,21 +201,25 @@ class ProjetViewSet(viewsets.ModelViewSet):
     @action(detail=False, methods=['get'])
     def publics(self, request):
         projets = self.get_queryset().filter(est_public=True)
-        page = self.paginate_queryset(projets)
+        # Sans view : le curseur utilise l'ordre de la pagination et non l'OrderingFilter
+        paginator = ProjetCursorPagination()
+        page = paginator.paginate_queryset(projets, request)
         if page is not None:
             serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+            return paginator.get_paginated_response(serializer.data)
         serializer = self.get_serializer(projets, many=True)
         return Response(serializer.data)
 
 class PortfolioViewSet(viewsets.ModelViewSet):
     queryset = Portfolio.objects.all()
     permission_classes = [PortfolioPermissions]
-    pagination_class = StandardResultsSetPagination
+    pagination_class = StandardCursorPagination
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['titre', 'description', 'titre_professionnel', 'biographie']
-    filterset_fields = ['statut', 'layout_type']
-    ordering_fields = ['date_creation', 'date_modification', 'vue_count', 'titre']
+    filterset_class = PortfolioFilter
+    # Uniquement des champs stables, compatibles avec la pagination par curseur
+    ordering_fields = ['date_creation', 'id_portfolio']
+    ordering = ('-date_creation', '-id_portfolio')
     
     def get_serializer_class(self):
         if self.action == 'list':
@@ -146,33 +232,42 @@ class PortfolioViewSet(viewsets.ModelViewSet):
             return PortfolioPublishSerializer
         return PortfolioDetailSerializer
     
+    def _prefetch_for_list(self, queryset):
+        # Les serializers de liste ne font que compter les relations
+        return queryset.select_related('utilisateur').only(*PORTFOLIO_LIST_FIELDS).prefetch_related(
+            Prefetch('contacts', queryset=Contact.objects.only('id_contact')),
+            Prefetch('competences', queryset=Competence.objects.only('id_competence')),
+            Prefetch('projets', queryset=Projet.objects.only('id_projet'))
+        )
+    
+    def _visibility_q(self):
+        # Portfolios visibles : publiés, ou appartenant à l'utilisateur (tous pour le staff)
+        user = self.request.user
+        if not user.is_authenticated:
+            return Q(statut='publie')
+        if user.is_staff:
+            return Q()
+        return Q(statut='publie') | Q(utilisateur=user)
+    
     def get_queryset(self):
-        queryset = Portfolio.objects.select_related('utilisateur').all()
-        statut = self.request.query_params.get('statut', None)
-        if statut:
-            queryset = queryset.filter(statut=statut)
-        
-        utilisateur_id = self.request.query_params.get('utilisateur', None)
-        if utilisateur_id:
-            queryset = queryset.filter(utilisateur__id_utilisateur=utilisateur_id)
-        
-        competence = self.request.query_params.get('competence', None)
-        if competence:
-            queryset = queryset.filter(competences__nom_competence__icontains=competence)
-        
-        langage = self.request.query_params.get('langage', None)
-        if langage:
-            queryset = queryset.filter(projets__langage_projet__icontains=langage)
-        
-        if not self.request.user.is_authenticated:
-            queryset = queryset.filter(statut='publie')
-        elif not self.request.user.is_staff:
-            # CORRECTION : Utiliser self.request.user directement
-            queryset = queryset.filter(
-                Q(statut='publie') | Q(utilisateur=self.request.user)
-            )
+        queryset = Portfolio.objects.select_related('utilisateur')
+        if self.action == 'list':
+            queryset = self._prefetch_for_list(queryset)
+        elif self.action in ['retrieve', 'publish']:
+            # Actions renvoyant PortfolioDetailSerializer
+            queryset = queryset.prefetch_related('contacts', 'competences', 'projets')
         
-        return queryset.distinct()
+        # Les filtres de requête (statut, competence, langage...) sont appliqués
+        # par PortfolioFilter via DjangoFilterBackend
+        return queryset.filter(self._visibility_q())
+    
+    def list(self, request, *args, **kwargs):
+        # Lecture seule : serpy à la place de PortfolioListSerializer
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(PortfolioListSerpy(page, many=True).data)
+        return Response(PortfolioListSerpy(queryset, many=True).data)
     
     def retrieve(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -183,14 +278,16 @@ class PortfolioViewSet(viewsets.ModelViewSet):
     
     @transaction.atomic
     def create(self, request, *args, **kwargs):
-        # CORRECTION : Utiliser request.user directement
-        if Portfolio.objects.filter(utilisateur=request.user).exists():
-            raise ValidationError("Vous avez déjà un portfolio")
-        
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        # L'unicité du portfolio par utilisateur est garantie par la base (OneToOneField)
+        try:
+            serializer.save()
+        except IntegrityError:
+            raise ValidationError("Vous avez déjà un portfolio")
         
+        # Charger les relations en une requête chacune, sans relire le portfolio
+        prefetch_related_objects([serializer.instance], 'contacts', 'competences', 'projets')
         detail_serializer = PortfolioDetailSerializer(
             serializer.instance,
             context={'request': request}
@@ -221,19 +318,20 @@ class PortfolioViewSet(viewsets.ModelViewSet):
     
     @action(detail=False, methods=['get'])
     def my_portfolio(self, request):
-        # CORRECTION : Supprimer la vérification hasattr
-        try:
-            portfolio = Portfolio.objects.get(utilisateur=request.user)
-            serializer = PortfolioDetailSerializer(
-                portfolio,
-                context={'request': request}
-            )
-            return Response(serializer.data)
-        except Portfolio.DoesNotExist:
+        # first() plutôt que get() : pas d'exception levée quand le portfolio n'existe pas
+        portfolio = Portfolio.objects.select_related('utilisateur').prefetch_related(
+            'contacts', 'competences', 'projets'
+        ).filter(utilisateur=request.user).first()
+        if portfolio is None:
             return Response(
                 {'message': 'Aucun portfolio trouvé pour cet utilisateur'},
                 status=status.HTTP_404_NOT_FOUND
             )
+        serializer = PortfolioDetailSerializer(
+            portfolio,
+            context={'request': request}
+        )
+        return Response(serializer.data)
     
     @action(detail=True, methods=['post'])
     def publish(self, request, pk=None):
@@ -260,6 +358,29 @@ class PortfolioViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['get'])
     def stats(self, request, pk=None):
         portfolio = self.get_object()
+        contacts = portfolio.contacts.aggregate(
+            total=Count('pk'),
+            principaux=Count('pk', filter=Q(est_principal=True))
+        )
+        competences = portfolio.competences.aggregate(
+            total=Count('pk'),
+            visibles=Count('pk', filter=Q(est_visible=True))
+        )
+        projets = portfolio.projets.aggregate(
+            total=Count('pk'),
+            publics=Count('pk', filter=Q(est_public=True))
+        )
+        categories = (
+            portfolio.competences.order_by()
+            .values('categorie')
+            .annotate(n=Count('pk'))
+        )
+        langages = (
+            portfolio.projets.order_by()
+            .values('langage_projet')
+            .annotate(n=Count('pk'))
+        )
+        
         stats = {
             'general': {
                 'vues': portfolio.vue_count,
@@ -270,50 +391,60 @@ class PortfolioViewSet(viewsets.ModelViewSet):
                 'jours_actif': (timezone.now() - portfolio.date_creation).days if portfolio.date_creation else 0
             },
             'contenu': {
-                'contacts': portfolio.contacts.count(),
-                'contacts_principaux': portfolio.contacts.filter(est_principal=True).count(),
-                'competences': portfolio.competences.count(),
-                'competences_visibles': portfolio.competences.filter(est_visible=True).count(),
-                'projets': portfolio.projets.count(),
-                'projets_publics': portfolio.projets.filter(est_public=True).count()
+                'contacts': contacts['total'],
+                'contacts_principaux': contacts['principaux'],
+                'competences': competences['total'],
+                'competences_visibles': competences['visibles'],
+                'projets': projets['total'],
+                'projets_publics': projets['publics']
+            },
+            'competences_par_categorie': {
+                CATEGORIE_LABELS.get(row['categorie'], row['categorie']): row['n']
+                for row in categories
             },
-            'competences_par_categorie': {},  # Ajouté
-            'projets_par_langage': {}  # Ajouté
+            'projets_par_langage': {
+                row['langage_projet']: row['n'] for row in langages
+            }
         }
         
-        competences = portfolio.competences.all()
-        for competence in competences:
-            categorie = competence.get_categorie_display()
-            if categorie not in stats['competences_par_categorie']:
-                stats['competences_par_categorie'][categorie] = 0
-            stats['competences_par_categorie'][categorie] += 1
-        
-        projets = portfolio.projets.all()
-        for projet in projets:
-            langage = projet.langage_projet
-            if langage not in stats['projets_par_langage']:
-                stats['projets_par_langage'][langage] = 0
-            stats['projets_par_langage'][langage] += 1
-        
         return Response(stats, status=status.HTTP_200_OK)
     
+    @action(detail=False, methods=['get'])
+    def count(self, request):
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response({'count': queryset.count()})
+    
+    def _with_published_cache_headers(self, request, response):
+        # ETag calculé par ConditionalGetMiddleware à partir du contenu rendu.
+        # Cache partagé uniquement pour le JSON anonyme : la page HTML de l'API
+        # navigable contient le nom de l'utilisateur et son jeton CSRF
+        if request.user.is_authenticated or request.accepted_renderer.format != 'json':
+            patch_cache_control(response, private=True, max_age=PUBLISHED_CACHE_TIMEOUT)
+        else:
+            patch_cache_control(response, public=True, max_age=PUBLISHED_CACHE_TIMEOUT)
+        patch_vary_headers(response, ('Accept', 'Authorization', 'Cookie'))
+        return response
+    
     @action(detail=False, methods=['get'])
     def published(self, request):
-        portfolios = Portfolio.objects.filter(statut='publie')
-        page = self.paginate_queryset(portfolios)
-        if page is not None:
-            serializer = PortfolioListSerializer(
-                page,
-                many=True,
-                context={'request': request}
-            )
-            return self.get_paginated_response(serializer.data)
-        serializer = PortfolioListSerializer(
-            portfolios,
-            many=True,
-            context={'request': request}
-        )
-        return Response(serializer.data)
+        portfolios = self._prefetch_for_list(Portfolio.objects.filter(statut='publie'))
+        if request.query_params.get('stream') == '1':
+            # Export complet : réponse envoyée au fil de la sérialisation
+            return self._with_published_cache_headers(request, StreamingHttpResponse(
+                stream_portfolios_json(portfolios.order_by(*StandardCursorPagination.ordering)),
+                content_type='application/json'
+            ))
+        # Seules les données sérialisées sont mises en cache, jamais la réponse rendue
+        key = published_cache_key(request)
+        data = cache.get(key)
+        if data is None:
+            page = self.paginate_queryset(portfolios)
+            if page is not None:
+                data = self.get_paginated_response(PortfolioListSerpy(page, many=True).data).data
+            else:
+                data = PortfolioListSerpy(portfolios, many=True).data
+            cache.set(key, data, PUBLISHED_CACHE_TIMEOUT)
+        return self._with_published_cache_headers(request, Response(data))
     
     @action(detail=True, methods=['post'])
     @transaction.atomic
@@ -321,187 +452,239 @@ class PortfolioViewSet(viewsets.ModelViewSet):
         portfolio = self.get_object()
         self.check_object_permissions(request, portfolio)
         
-        # CORRECTION : Utiliser request.user directement
-        if Portfolio.objects.filter(utilisateur=request.user).exists():
-            raise ValidationError("Vous avez déjà un portfolio")
-        
-        new_portfolio = Portfolio.objects.create(
-            utilisateur=request.user,
-            titre=f"{portfolio.titre} (Copie)",
-            description=portfolio.description,
-            titre_professionnel=portfolio.titre_professionnel,
-            biographie=portfolio.biographie,
-            statut='brouillon',
-            theme_couleur=portfolio.theme_couleur,
-            layout_type=portfolio.layout_type,
-            meta_description=portfolio.meta_description,
-            meta_keywords=portfolio.meta_keywords,
-            afficher_photo=portfolio.afficher_photo,
-            afficher_competences=portfolio.afficher_competences,
-            afficher_projets=portfolio.afficher_projets,
-            afficher_contacts=portfolio.afficher_contacts,
-            afficher_formations=portfolio.afficher_formations,
-            afficher_experiences=portfolio.afficher_experiences,
-            formations=portfolio.formations,
-            experiences=portfolio.experiences,
-            langues=portfolio.langues,
-            certifications=portfolio.certifications,
-            interets=portfolio.interets
-        )
-        
-        for contact in portfolio.contacts.all():
-            new_contact = Contact.objects.create(
-                type_contact=contact.type_contact,
-                valeur_contact=contact.valeur_contact,
+        try:
+            new_portfolio = Portfolio.objects.create(
                 utilisateur=request.user,
-                est_principal=contact.est_principal,
-                ordre=contact.ordre
+                titre=f"{portfolio.titre} (Copie)",
+                description=portfolio.description,
+                titre_professionnel=portfolio.titre_professionnel,
+                biographie=portfolio.biographie,
+                statut='brouillon',
+                theme_couleur=portfolio.theme_couleur,
+                layout_type=portfolio.layout_type,
+                meta_description=portfolio.meta_description,
+                meta_keywords=portfolio.meta_keywords,
+                afficher_photo=portfolio.afficher_photo,
+                afficher_competences=portfolio.afficher_competences,
+                afficher_projets=portfolio.afficher_projets,
+                afficher_contacts=portfolio.afficher_contacts,
+                afficher_formations=portfolio.afficher_formations,
+                afficher_experiences=portfolio.afficher_experiences,
+                formations=portfolio.formations,
+                experiences=portfolio.experiences,
+                langues=portfolio.langues,
+                certifications=portfolio.certifications,
+                interets=portfolio.interets
             )
-            new_portfolio.contacts.add(new_contact)
+        except IntegrityError:
+            raise ValidationError("Vous avez déjà un portfolio")
         
-        for competence in portfolio.competences.all():
-            new_competence = Competence.objects.create(
-                nom_competence=competence.nom_competence,
-                niveau_competence=competence.niveau_competence,
-                categorie=competence.categorie,
-                utilisateur=request.user,
-                annees_experience=competence.annees_experience,
-                description=competence.description,
-                est_visible=competence.est_visible,
-                ordre=competence.ordre
-            )
-            new_portfolio.competences.add(new_competence)
+        new_contacts = Contact.objects.bulk_create([
+            Contact(utilisateur=request.user, **{f: getattr(contact, f) for f in CONTACT_CLONE_FIELDS})
+            for contact in portfolio.contacts.only(*CONTACT_CLONE_FIELDS)
+        ])
+        new_competences = Competence.objects.bulk_create([
+            Competence(utilisateur=request.user, **{f: getattr(competence, f) for f in COMPETENCE_CLONE_FIELDS})
+            for competence in portfolio.competences.only(*COMPETENCE_CLONE_FIELDS)
+        ])
+        new_projets = Projet.objects.bulk_create([
+            Projet(utilisateur=request.user, **{f: getattr(projet, f) for f in PROJET_CLONE_FIELDS})
+            for projet in portfolio.projets.only(*PROJET_CLONE_FIELDS)
+        ])
         
-        for projet in portfolio.projets.all():
-            new_projet = Projet.objects.create(
-                titre_projet=projet.titre_projet,
-                description_projet=projet.description_projet,
-                langage_projet=projet.langage_projet,
-                utilisateur=request.user,
-                lien_projet=projet.lien_projet,
-                lien_github=projet.lien_github,
-                technologies=projet.technologies,
-                date_realisation=projet.date_realisation,
-                est_public=projet.est_public,
-                est_termine=projet.est_termine,
-                ordre=projet.ordre
-            )
-            new_portfolio.projets.add(new_projet)
+        new_portfolio.contacts.add(*new_contacts)
+        new_portfolio.competences.add(*new_competences)
+        new_portfolio.projets.add(*new_projets)
+        # bulk_create n'émet pas post_save : invalider le cache manuellement (après COMMIT)
+        invalidate_competences_par_categorie(request.user.pk)
         
         return Response(
             PortfolioDetailSerializer(new_portfolio, context={'request': request}).data,
             status=status.HTTP_201_CREATED
         )
     
-    @action(detail=True, methods=['post'])
-    def add_contact(self, request, pk=None):
+    # type d'élément -> (modèle, relation du portfolio, message si non possédé, message si absent)
+    _ADD_MAP = {
+        'contact': (Contact, 'contacts', "Ce contact ne vous appartient pas", 'Contact non trouvé'),
+        'competence': (Competence, 'competences', "Cette compétence ne vous appartient pas", 'Compétence non trouvé'),
+        'projet': (Projet, 'projets', "Ce projet ne vous appartient pas", 'Projet non trouvé'),
+    }
+    
+    def _add_item(self, request, kind):
+        model, relation, message_proprietaire, message_absent = self._ADD_MAP[kind]
         portfolio = self.get_object()
-        contact_id = request.data.get('contact_id')
-        if not contact_id:
+        # Un corps JSON qui n'est pas un objet (liste...) est traité comme vide
+        item_id = request.data.get(f'{kind}_id') if isinstance(request.data, dict) else None
+        if not item_id:
             return Response(
-                {'error': 'contact_id est requis'},
+                {'error': f'{kind}_id est requis'},
                 status=status.HTTP_400_BAD_REQUEST
             )
-        
         try:
-            contact = Contact.objects.get(id_contact=contact_id)
-            # CORRECTION : Utiliser request.user directement
-            if contact.utilisateur != request.user:
-                raise PermissionDenied("Ce contact ne vous appartient pas")
-            portfolio.contacts.add(contact)
+            # Même conversion que les IntegerField DRF (refuse booléens et décimaux)
+            item_id = serializers.IntegerField().to_internal_value(item_id)
+        except ValidationError:
             return Response(
-                PortfolioDetailSerializer(portfolio, context={'request': request}).data,
-                status=status.HTTP_200_OK
-            )
-        except Contact.DoesNotExist:
-            return Response(
-                {'error': 'Contact non trouvé'},
-                status=status.HTTP_404_NOT_FOUND
+                {'error': f'{kind}_id doit être un entier'},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # Existence et propriété en une requête, sans charger la ligne
+        if not model.objects.filter(pk=item_id, utilisateur_id=request.user.pk).exists():
+            # Chemin d'erreur uniquement : distinguer absent / non possédé
+            if not model.objects.filter(pk=item_id).exists():
+                return Response(
+                    {'error': message_absent},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+            raise PermissionDenied(message_proprietaire)
+        getattr(portfolio, relation).add(item_id)
+        return Response(
+            {'status': 'ok', 'id': item_id},
+            status=status.HTTP_200_OK
+        )
+    
+    @action(detail=True, methods=['post'])
+    def add_contact(self, request, pk=None):
+        return self._add_item(request, 'contact')
     
     @action(detail=True, methods=['post'])
     def add_competence(self, request, pk=None):
-        portfolio = self.get_object()
-        competence_id = request.data.get('competence_id')
-        if not competence_id:
-            return Response(
-                {'error': 'competence_id est requis'},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            competence = Competence.objects.get(id_competence=competence_id)
-            # CORRECTION : Utiliser request.user directement
-            if competence.utilisateur != request.user:
-                raise PermissionDenied("Cette compétence ne vous appartient pas")
-            portfolio.competences.add(competence)
-            return Response(
-                PortfolioDetailSerializer(portfolio, context={'request': request}).data,
-                status=status.HTTP_200_OK
-            )
-        except Competence.DoesNotExist:
-            return Response(
-                {'error': 'Compétence non trouvé'},
-                status=status.HTTP_404_NOT_FOUND
-            )
+        return self._add_item(request, 'competence')
     
     @action(detail=True, methods=['post'])
     def add_projet(self, request, pk=None):
+        return self._add_item(request, 'projet')
+    
+    @action(detail=True, methods=['post'])
+    @transaction.atomic
+    def add_items(self, request, pk=None):
         portfolio = self.get_object()
-        projet_id = request.data.get('projet_id')
-        if not projet_id:
-            return Response(
-                {'error': 'projet_id est requis'},
-                status=status.HTTP_400_BAD_REQUEST
+        serializer = PortfolioAddItemsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        items = {}
+        for relation, model in PORTFOLIO_RELATIONS:
+            ids = set(serializer.validated_data.get(relation, []))
+            # Existence et propriété vérifiées en une seule requête
+            if ids:
+                possedes = set(
+                    model.objects.filter(pk__in=ids, utilisateur_id=request.user.pk)
+                    .values_list('pk', flat=True)
+                )
+                refuses = ids - possedes
+                if refuses:
+                    raise PermissionDenied(
+                        f"Éléments de {relation} inexistants ou non possédés : {sorted(refuses)}"
+                    )
+            items[relation] = ids
+        
+        for relation, ids in items.items():
+            if ids:
+                getattr(portfolio, relation).add(*ids)
+        
+        return Response(
+            {'status': 'ok', **{relation: sorted(ids) for relation, ids in items.items()}},
+            status=status.HTTP_200_OK
+        )
+    
+    def _search_elasticsearch(self, request):
+        from .documents import PortfolioDocument
+        
+        # Mêmes paramètres et même validation que la recherche en base
+        filterset = PortfolioFilter(request.query_params, queryset=Portfolio.objects.none())
+        if not filterset.is_valid():
+            raise ValidationError(filterset.errors)
+        criteres = filterset.form.cleaned_data
+        
+        recherche = PortfolioDocument.search().filter('term', statut='publie')
+        if criteres.get('statut'):
+            recherche = recherche.filter('term', statut=criteres['statut'])
+        
+        if criteres.get('utilisateur') is not None:
+            recherche = recherche.filter('term', utilisateur=int(criteres['utilisateur']))
+        
+        if criteres.get('layout_type'):
+            recherche = recherche.filter('term', layout_type=criteres['layout_type'])
+        
+        if criteres.get('competence'):
+            recherche = recherche.query('match', competence_names=criteres['competence'])
+        
+        if criteres.get('langage'):
+            recherche = recherche.query('match', langages=criteres['langage'])
+        
+        if criteres.get('niveau'):
+            recherche = recherche.filter('term', niveaux=criteres['niveau'])
+        
+        if criteres.get('categorie'):
+            recherche = recherche.filter('term', categories=criteres['categorie'])
+        
+        # ?search= : tous les termes doivent apparaître dans un des search_fields
+        terme = request.query_params.get(filters.SearchFilter.search_param, '').strip()
+        if terme:
+            recherche = recherche.query(
+                'multi_match', query=terme, fields=self.search_fields, operator='and'
             )
         
+        # ?ordering= : mêmes champs autorisés qu'en base, sinon tri par pertinence
+        tri = [
+            champ.strip() for champ in request.query_params.get('ordering', '').split(',')
+            if champ.strip().lstrip('-') in self.ordering_fields
+        ]
+        if tri:
+            recherche = recherche.sort(*tri)
+        
         try:
-            projet = Projet.objects.get(id_projet=projet_id)
-            # CORRECTION : Utiliser request.user directement
-            if projet.utilisateur != request.user:
-                raise PermissionDenied("Ce projet ne vous appartient pas")
-            portfolio.projets.add(projet)
+            limit = max(1, min(
+                int(request.query_params.get('page_size', StandardCursorPagination.page_size)),
+                StandardCursorPagination.max_page_size
+            ))
+            offset = max(int(request.query_params.get('offset', 0)), 0)
+        except ValueError:
             return Response(
-                PortfolioDetailSerializer(portfolio, context={'request': request}).data,
-                status=status.HTTP_200_OK
+                {'error': 'page_size et offset doivent être des entiers'},
+                status=status.HTTP_400_BAD_REQUEST
             )
-        except Projet.DoesNotExist:
+        if offset + limit > ELASTICSEARCH_MAX_RESULT_WINDOW:
             return Response(
-                {'error': 'Projet non trouvé'},
-                status=status.HTTP_404_NOT_FOUND
+                {'error': f'offset + page_size ne peut pas dépasser {ELASTICSEARCH_MAX_RESULT_WINDOW}'},
+                status=status.HTTP_400_BAD_REQUEST
             )
+        
+        # Elasticsearch ne renvoie que les identifiants, dans l'ordre demandé
+        reponse = recherche[offset:offset + limit].source(False).execute()
+        ids = [int(hit.meta.id) for hit in reponse]
+        portfolios = self._prefetch_for_list(
+            Portfolio.objects.filter(statut='publie')
+        ).in_bulk(ids)
+        serializer = PortfolioListSerpy(
+            [portfolios[pk] for pk in ids if pk in portfolios],
+            many=True
+        )
+        
+        # Même enveloppe que la pagination par curseur : next / previous / results
+        url = request.build_absolute_uri()
+        suivant = None
+        if offset + limit < reponse.hits.total.value:
+            suivant = replace_query_param(url, 'offset', offset + limit)
+        precedent = None
+        if offset > limit:
+            precedent = replace_query_param(url, 'offset', offset - limit)
+        elif offset > 0:
+            precedent = remove_query_param(url, 'offset')
+        return Response({
+            'next': suivant,
+            'previous': precedent,
+            'results': serializer.data
+        })
     
     @action(detail=False, methods=['get'])
     def search(self, request):
-        queryset = Portfolio.objects.filter(statut='publie')
-        competence = request.query_params.get('competence', None)
-        if competence:
-            queryset = queryset.filter(competences__nom_competence__icontains=competence)
-        
-        langage = request.query_params.get('langage', None)
-        if langage:
-            queryset = queryset.filter(projets__langage_projet__icontains=langage)
-        
-        niveau = request.query_params.get('niveau', None)
-        if niveau:
-            queryset = queryset.filter(competences__niveau_competence=niveau)
-        
-        categorie = request.query_params.get('categorie', None)
-        if categorie:
-            queryset = queryset.filter(competences__categorie=categorie)
+        if getattr(settings, 'ELASTICSEARCH_DSL', None):
+            return self._search_elasticsearch(request)
         
-        page = self.paginate_queryset(queryset.distinct())
+        queryset = self.filter_queryset(Portfolio.objects.filter(statut='publie'))
+        queryset = self._prefetch_for_list(queryset)
+        page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = PortfolioListSerializer(
-                page,
-                many=True,
-                context={'request': request}
-            )
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = PortfolioListSerializer(
-            queryset.distinct(),
-            many=True,
-            context={'request': request}
-        )
-        return Response(serializer.data)
\ No newline at end of file
+            return self.get_paginated_response(PortfolioListSerpy(page, many=True).data)
+        return Response(PortfolioListSerpy(queryset, many=True).data)
\ No newline at end of file